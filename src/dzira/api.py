@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
-from jira import JIRA, Issue
-from jira.resources import Board, Sprint, Worklog
+if TYPE_CHECKING:
+    from jira import JIRA, Issue
+    from jira.resources import Board, Sprint, Worklog
+else:
+    JIRA = None
+
+
+def _load_jira():
+    global JIRA
+    if JIRA is None:
+        from jira import JIRA
+    return JIRA
 
 
 def connect_to_jira(server: str, email: str, token: str) -> JIRA:
-    return JIRA(server=f"https://{server}", basic_auth=(email, token))
+    return _load_jira()(server=f"https://{server}", basic_auth=(email, token))
 
 
 def get_board_by_key(jira: JIRA, key: str) -> Board:
@@ -90,19 +101,30 @@ def get_issues_by_work_logged_on_date(
     return jira.search_issues(query, fields=fields)
 
 
+# search results embed at most this many worklogs, above it they have to be requested
+EMBEDDED_WORKLOGS_LIMIT = 20
+
+
+def _count_embedded_worklogs(issue: Issue) -> int:
+    try:
+        return len(issue.fields.worklog.worklogs)
+    except (AttributeError, TypeError):
+        return 0
+
+
+def needs_worklogs_request(issue: Issue) -> bool:
+    return _count_embedded_worklogs(issue) >= EMBEDDED_WORKLOGS_LIMIT
+
+
 def get_issue_worklogs_by_user_and_date(
         jira: JIRA, issue: Issue, user_email: str, report_date: datetime
 ) -> list:
     matching = []
-
-    try:
-        worklog_count = len(issue.fields.worklog.worklogs)
-    except (AttributeError, TypeError):
-        worklog_count = 0
+    worklog_count = _count_embedded_worklogs(issue)
 
     if worklog_count == 0:
         return matching
-    elif worklog_count < 20:
+    elif worklog_count < EMBEDDED_WORKLOGS_LIMIT:
         worklogs = issue.fields.worklog.worklogs
     else:
         worklogs = jira.worklogs(issue.id)
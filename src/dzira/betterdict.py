@@ -2,14 +2,11 @@ from typing import Iterable
 
 
 class D(dict):
-    def __getattr__(self, key):
-        return self.get(key)
+    __slots__ = ()
 
-    def __setattr__(self, key, value):
-        super().__setitem__(key, value)
-
-    def __delattr__(self, item):
-        self.__delitem__(item)
+    __getattr__ = dict.get
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__
 
     def __call__(self, *keys) -> Iterable:
         if keys:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import concurrent.futures
 import csv
 import json
 import re
 import subprocess
 import sys
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import click
-from jira import JIRA
-from jira.resources import Board, Sprint, Worklog
 from tabulate import tabulate
 
 from dzira import api
@@ -27,6 +28,10 @@ from .config import (
     get_config,
 )
 
+if TYPE_CHECKING:
+    from jira import JIRA
+    from jira.resources import Board, Sprint, Worklog
+
 
 colors = Colors()
 c = colors.c
@@ -120,7 +125,7 @@ def _update_worklog(
         )
     fields = {
         k: v
-        for k, v in zip(["timeSpentSeconds", "comment", "started"], [time, comment, date])
+        for k, v in {"timeSpentSeconds": time, "comment": comment, "started": date}.items()
         if v
     }
     worklog.update(fields=fields)
@@ -199,13 +204,13 @@ def cli(ctx, file, key, token, email, server, spin, color):
     ctx.ensure_object(dict)
     cfg = {
         k: v
-        for k, v in dict(
-                file=file,
-                JIRA_EMAIL=email,
-                JIRA_PROJECT_KEY=key,
-                JIRA_SERVER=server,
-                JIRA_TOKEN=token,
-        ).items()
+        for k, v in {
+                "file": file,
+                "JIRA_EMAIL": email,
+                "JIRA_PROJECT_KEY": key,
+                "JIRA_SERVER": server,
+                "JIRA_TOKEN": token,
+        }.items()
         if v is not None
     }
     ctx.obj.update(cfg)
@@ -377,19 +382,23 @@ def ls(ctx, state, sprint_id, format):
 
 ### Validators
 
+HOUR_SEPARATOR_RE = re.compile(r"[,.h]")
+ONLY_MINUTES_RE = re.compile(r"(?P<m>(\d{2}|[1-4]\d{2}))m")
+HOURS_AND_MINUTES_RE = re.compile(r"(?P<h>([1-8]))h(\s*(?=\d))?((?P<m>([1-5]\d|[1-9]))m?)?")
+VALID_HOUR_RE = re.compile(r"(([01]?\d|2[0-3])[:.h,])+([0-5]?\d)")
+
+
 def matches_time_re(time: str) -> D:
     """
     Allows strings '[h][ [m]]' with or without format indicators 'h/m',
     not greater than 8h 59m, or only minutes not greater than 499m.
     """
-    only_mins = re.compile(r"^(?P<m>(\d{2}|[1-4]\d{2}))m$")
-    hours_and_mins = re.compile(r"^(?P<h>([1-8]))h(\s*(?=\d))?((?P<m>([1-5]\d|[1-9]))m?)?$")
-    m = only_mins.match(time) or hours_and_mins.match(time)
+    m = ONLY_MINUTES_RE.fullmatch(time) or HOURS_AND_MINUTES_RE.fullmatch(time)
     return D(m.groupdict() if m is not None else {})
 
 
 def is_valid_hour(hour) -> bool:
-    return re.match(r"^(([01]?\d|2[0-3])[:.h,])+([0-5]?\d)$", hour) is not None
+    return VALID_HOUR_RE.fullmatch(hour) is not None
 
 
 def validate_time(_, __, time) -> int:
@@ -416,13 +425,16 @@ def validate_hour(ctx, param, value):
     if value is None:
         return
     if is_valid_hour(value):
-        return re.sub(r"[,.h]", ":", value)
+        return HOUR_SEPARATOR_RE.sub(":", value)
     raise click.BadParameter(
         "start/end time has to be in format '[H[H]][:.h,][M[M]]', e.g. '2h3', '12:03', '3,59'"
     )
 
 
 VALIDATE_DATE_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M")
+_VALIDATE_DATE_FORMATS_MSG = (
+    f"date has to match one of supported ISO formats: {', '.join(VALIDATE_DATE_FORMATS)}"
+)
 
 
 def validate_date(ctx, _, value):
@@ -445,9 +457,7 @@ def validate_date(ctx, _, value):
             pass
 
     if not isinstance(given_datetime, datetime):
-        raise click.BadParameter(
-            f"date has to match one of supported ISO formats: {', '.join(VALIDATE_DATE_FORMATS)}"
-        )
+        raise click.BadParameter(_VALIDATE_DATE_FORMATS_MSG)
     if given_datetime > now:
         raise click.BadParameter("worklog date cannot be in future!")
     if (now - given_datetime).days > 14:
@@ -484,6 +494,11 @@ def sanitize_params(args: D) -> D:
 
 ### Payload
 
+def _hour_to_seconds(hour: str) -> int:
+    h, m = HOUR_SEPARATOR_RE.sub(":", hour).split(":", 1)
+    return int(h) * 3600 + int(m) * 60
+
+
 def calculate_seconds(payload: D) -> D:
     start, end = payload("start", "end")
 
@@ -491,19 +506,20 @@ def calculate_seconds(payload: D) -> D:
         time = payload.get("time")
         return payload.update("seconds", time)
 
-    fmt = "%H:%M"
-    unify = lambda t: datetime.strptime(re.sub(r"[,.h]", ":", t), fmt)
-    t2 = (
-        datetime.strptime(datetime.now().strftime("%H:%M"), fmt)
-        if end is None else unify(end)
-    )
-    t1 = unify(start)
+    if end is None:
+        now = datetime.now()
+        t2 = now.hour * 3600 + now.minute * 60
+    else:
+        t2 = _hour_to_seconds(end)
+    t1 = _hour_to_seconds(start)
 
     if t2 < t1:
         raise click.BadParameter("start time cannot be later than end time")
     else:
-        delta_seconds = (t2 - t1).total_seconds()
-        return payload.update("seconds", int(delta_seconds))
+        return payload.update("seconds", t2 - t1)
+
+
+ISSUE_KEY_RE = re.compile(r"[A-Z][A-Z0-9_]+-\d+")
 
 
 def establish_issue(jira: JIRA, payload: D) -> D:
@@ -512,9 +528,12 @@ def establish_issue(jira: JIRA, payload: D) -> D:
 
     if issue.isdigit():
         return payload.update("issue", f"{key}-{issue}")
+    if ISSUE_KEY_RE.fullmatch(issue):
+        return payload
 
     sprint_issues = get_issues(jira, payload).result
-    candidates = [i for i in sprint_issues.issues if issue.lower() in i.fields.summary.lower()]
+    phrase = issue.lower()
+    candidates = [i for i in sprint_issues.issues if phrase in i.fields.summary.lower()]
 
     if not candidates:
         raise Exception("could not find any matching issues")
@@ -589,8 +608,8 @@ def perform_log_action(jira: JIRA, payload: D) -> None:
 @click.help_option("-h", "--help")
 def log(ctx, **_):
     """
-    Log time spent on ISSUE number or ISSUE with description containing
-    matching string.
+    Log time spent on ISSUE key or number, or ISSUE with description
+    containing matching string.
 
     TIME spent should be in format '[[Nh][ ]][Nm]'; or it can be
     calculated when START time is be provided; it's assumed that time
@@ -650,15 +669,30 @@ def get_issues_with_work_logged_on_date(
     )
 
 
+WORKLOGS_FETCH_WORKERS = 8
+
+
 @spinner.run("Getting worklogs")
 def get_user_worklogs_from_date(jira: JIRA, user_email: str, issues: Result) -> Result:
     worklogs = D(counter=0)
+    report_date = issues.data.report_date
+    assert type(report_date) == datetime, f"Got unexpected report_date type {type(report_date)}"
+
+    def find_worklogs(issue):
+        return api.get_issue_worklogs_by_user_and_date(jira, issue, user_email, report_date)
+
+    # only issues with more worklogs than search results embed need a request of their own,
+    # the rest are filtered in memory and gain nothing from threads
+    requested = [issue for issue in issues.result if api.needs_worklogs_request(issue)]
+    found = {}
+    if len(requested) > 1:
+        workers = min(WORKLOGS_FETCH_WORKERS, len(requested))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(find_worklogs, requested)
+            found = {issue.id: matching for issue, matching in zip(requested, results)}
+
     for issue in issues.result:
-        report_date = issues.data.report_date
-        assert type(report_date) == datetime, f"Got unexpected report_date type {type(report_date)}"
-        matching: list = api.get_issue_worklogs_by_user_and_date(
-            jira, issue, user_email, report_date
-        )
+        matching = found[issue.id] if issue.id in found else find_worklogs(issue)
         if matching:
             worklogs[issue.id] = D(key=issue.key, summary=issue.fields.summary, worklogs=matching)
             worklogs.update(counter=lambda x: x + (len(matching)))
@@ -672,6 +706,32 @@ def get_user_worklogs_from_date(jira: JIRA, user_email: str, issues: Result) ->
     )
 
 
+JIRA_TIMESTAMP_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})\.(\d{1,6})([+-])(\d{2}):?(\d{2})$"
+)
+
+
+@lru_cache(maxsize=None)
+def _utc_offset(sign: str, hours: str, minutes: str) -> timezone:
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    return timezone(-offset if sign == "-" else offset)
+
+
+def _parse_jira_timestamp(timestamp: str) -> datetime:
+    """
+    Parses timestamps like '2023-11-26T13:42:16.000+0100' returned by
+    Jira without going through `datetime.strptime`.
+    """
+    m = JIRA_TIMESTAMP_RE.match(timestamp)
+    if m is None:
+        return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f%z")
+    *fields, fraction, sign, off_h, off_m = m.groups()
+    return datetime(
+        *map(int, fields), int(fraction.ljust(6, "0")), tzinfo=_utc_offset(sign, off_h, off_m)
+    )
+
+
+@lru_cache(maxsize=2048)
 def _seconds_to_hour_minute_fmt(seconds):
     hours, remainder = divmod(seconds, 3600)
     minutes, _ = divmod(remainder, 60)
@@ -694,8 +754,7 @@ def show_report(issues_to_worklogs: D, format: str | None) -> None:
             )
             total_time += time_spent_seconds
             issue_total_time += time_spent_seconds
-            local_timestamp = datetime.strptime(started, '%Y-%m-%dT%H:%M:%S.%f%z').astimezone()
-            formatted_time = local_timestamp.strftime('%H:%M:%S')
+            formatted_time = _parse_jira_timestamp(started).astimezone().strftime("%H:%M:%S")
 
             if format == "csv":
                 processed_worklog = [
@@ -705,7 +764,7 @@ def show_report(issues_to_worklogs: D, format: str | None) -> None:
             elif format == "json":
                 processed_worklog = {
                     "id": w.id,
-                    "started": local_timestamp.strftime("%H:%M:%S"),
+                    "started": formatted_time,
                     "spent": time_spent,
                     "spent_seconds": time_spent_seconds,
                     "comment": comment
@@ -733,9 +792,9 @@ def show_report(issues_to_worklogs: D, format: str | None) -> None:
 
     if format == "csv":
         headers = ["issue", "summary", "worklog", "started", "spent", "spent_seconds", "comment"]
-        writer = csv.DictWriter(sys.stdout, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows([dict(zip(headers, row)) for row in csv_rows])
+        writer = csv.writer(sys.stdout)
+        writer.writerow(headers)
+        writer.writerows(csv_rows)
     elif format == "json":
         json_dict["total_time"] = _seconds_to_hour_minute_fmt(total_time)
         json_dict["total_seconds"] = total_time
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from dotenv import dotenv_values
 from tabulate import tabulate_formats
 
 from dzira.betterdict import D
 
+if TYPE_CHECKING:
+    from dotenv import dotenv_values
+else:
+    dotenv_values = None
+
 
 CONFIG_DIR_NAME = "dzira"
 DOTFILE = f".{CONFIG_DIR_NAME}"
@@ -16,34 +21,72 @@ VALID_OUTPUT_FORMATS = sorted(tabulate_formats + ["json", "csv"])
 DEFAULT_OUTPUT_FORMAT = "simple_grid"
 
 
+def _load_dotenv_values():
+    global dotenv_values
+    if dotenv_values is None:
+        from dotenv import dotenv_values
+    return dotenv_values
+
+
+def _default_config_path() -> str | None:
+    home = os.environ["HOME"]
+    return _find_config_file(os.environ.get("XDG_CONFIG_HOME", home), home)
+
+
+# only found paths are cached, so a config file created later is still picked up
+_config_file_cache: dict[tuple[str, str], str] = {}
+
+
+def _find_config_file(config_file_dir: str, home: str) -> str | None:
+    key = config_file_dir, home
+    if key in _config_file_cache:
+        return _config_file_cache[key]
+
+    for path in (
+            os.path.join(config_file_dir, CONFIG_DIR_NAME, "env"),
+            os.path.join(config_file_dir, DOTFILE),
+            os.path.join(home, ".config", CONFIG_DIR_NAME, "env"),
+            os.path.join(home, ".config", DOTFILE),
+    ):
+        if os.path.isfile(path):
+            _config_file_cache[key] = path
+            return path
+    return None
+
+
+_dotenv_cache: dict[str, tuple[float, dict]] = {}
+
+
 def get_config_from_file(config_file: str | Path | None = None) -> dict:
     if config_file is None:
-        config_file_dir = os.environ.get("XDG_CONFIG_HOME", os.environ["HOME"])
-        for path in (
-                os.path.join(config_file_dir, CONFIG_DIR_NAME, "env"),
-                os.path.join(config_file_dir, DOTFILE),
-                os.path.join(os.environ["HOME"], ".config", CONFIG_DIR_NAME, "env"),
-                os.path.join(os.environ["HOME"], ".config", DOTFILE),
-        ):
-            if os.path.isfile(path):
-                config_file = path
-                break
+        config_file = _default_config_path()
+        if config_file is None:
+            return {}
 
-    return dotenv_values(config_file)
+    try:
+        stream = open(config_file, encoding="utf-8")
+    except OSError:
+        return {}
+
+    with stream:
+        mtime = os.fstat(stream.fileno()).st_mtime
+        cached = _dotenv_cache.get(str(config_file))
+        if cached is None or cached[0] != mtime:
+            cached = _dotenv_cache[str(config_file)] = (
+                mtime, _load_dotenv_values()(stream=stream)
+            )
+    return dict(cached[1])
 
 
 def get_config(config: dict = {}) -> D:
-    for cfg_fn in (
-        lambda: get_config_from_file(config.get("file")),
-        lambda: (_ for _ in ()).throw(
-            Exception(
-                "could not find required config values: "
-                f"{', '.join(sorted(set(REQUIRED_KEYS).difference(set(config))))}"
-            )
-        ),
-    ):
-        if set(REQUIRED_KEYS).issubset(config.keys()):
-            break
-        config = {**cfg_fn(), **config}
+    # not cached: runs once per CLI invocation, and get_config_from_file
+    # already caches the parsed file
+    required = frozenset(REQUIRED_KEYS)
+
+    if not required.issubset(config):
+        config = {**get_config_from_file(config.get("file")), **config}
+
+    if (missing := required.difference(config)):
+        raise Exception(f"could not find required config values: {', '.join(sorted(missing))}")
 
     return D(config)
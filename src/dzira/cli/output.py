@@ -8,8 +8,6 @@ from functools import wraps
 from itertools import cycle
 from typing import Any
 
-from jira.exceptions import JIRAError
-
 from dzira.betterdict import D
 
 
@@ -30,7 +28,8 @@ class Colors:
         return "".join([a for a in args if a not in self.C])
 
 
-@dataclass
+# `slots` is only supported by dataclasses on Python 3.10+
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class Result:
     result: Any = None
     stdout: str = ""
@@ -77,6 +76,8 @@ class Spinner:
                         )
                         return r
                 except Exception as exc:
+                    from jira.exceptions import JIRAError
+
                     if type(exc) == JIRAError:
                         messages = exc.response.json().get("errorMessages", [])
                         if messages:
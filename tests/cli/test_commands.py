@@ -1,9 +1,11 @@
+import concurrent.futures
 import datetime
 import os
 import sys
 import time
 from collections import namedtuple
-from unittest.mock import Mock, PropertyMock, call, patch, sentinel
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, call, patch, sentinel
 
 if sys.version_info > (3, 9):
     from zoneinfo import ZoneInfo
@@ -22,6 +24,7 @@ from dzira.cli.commands import (
     Result,
     VALIDATE_DATE_FORMATS,
     VALID_OUTPUT_FORMATS,
+    _parse_jira_timestamp,
     _seconds_to_hour_minute_fmt,
     _update_worklog,
     add_worklog,
@@ -33,8 +36,6 @@ from dzira.cli.commands import (
     establish_issue,
     get_board,
     get_issues,
-    get_issues,
-    get_issues,
     get_issues_with_work_logged_on_date,
     get_jira,
     get_sprint,
@@ -61,11 +62,27 @@ from dzira.cli.commands import (
     validate_output_format,
     validate_time,
 )
+from dzira.cli.config import REQUIRED_KEYS
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for key in REQUIRED_KEYS:
+        monkeypatch.delenv(key, raising=False)
 
 
 @pytest.fixture
-def mock_print(mocker):
-    return mocker.patch("dzira.cli.commands.print")
+def runner():
+    return CliRunner()
+
+
+# let exceptions propagate instead of having click turn them into exit codes
+IN_PROCESS = {"standalone_mode": False, "catch_exceptions": False}
+
+
+@pytest.fixture
+def mock_jira():
+    return Mock()
 
 
 @pytest.fixture
@@ -125,10 +142,9 @@ def mock_connect_to_jira(mocker):
 
 @pytest.fixture
 def mock_get_board_by_key(mocker):
-    return mocker.patch(
-        "dzira.cli.commands.api.get_board_by_key",
-        Mock(return_value=Mock(raw={"location": {"displayName": "BoardName"}}))
-    )
+    stub = mocker.stub(name="get_board_by_key")
+    stub.return_value = SimpleNamespace(raw={"location": {"displayName": "BoardName"}})
+    return mocker.patch("dzira.cli.commands.api.get_board_by_key", stub)
 
 
 @pytest.fixture
@@ -138,10 +154,18 @@ def mock_get_sprint_by_id(mocker):
 
 @pytest.fixture
 def mock_get_sprints_by_board(mocker):
-    return mocker.patch(
-        "dzira.cli.commands.api.get_sprints_by_board",
-        Mock(return_value=[sentinel.sprint1])
-    )
+    stub = mocker.stub(name="get_sprints_by_board")
+    stub.return_value = [sentinel.sprint1]
+    return mocker.patch("dzira.cli.commands.api.get_sprints_by_board", stub)
+
+
+FROZEN_NOW = datetime.datetime(2023, 11, 23, 14, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw"))
+
+
+@pytest.fixture
+def frozen_now():
+    with time_machine.travel(FROZEN_NOW, tick=False):
+        yield FROZEN_NOW
 
 
 class TestGetJira:
@@ -169,9 +193,7 @@ class TestGetBoard:
     def test_is_decorated_correctly(self):
         assert get_board.is_decorated_with_spinner
 
-    def test_gets_board(self, mock_get_board_by_key):
-        mock_jira = Mock()
-
+    def test_gets_board(self, mock_get_board_by_key, mock_jira):
         result = get_board(mock_jira, sentinel.key)
 
         mock_get_board_by_key.assert_called_once_with(mock_jira, sentinel.key)
@@ -215,9 +237,9 @@ class TestGetSprint:
 
 
 class TestAddWorklog:
-    def test_calls_log_work_with_provided_values(self):
-        mock_worklog = Mock(raw={"timeSpent": "2h"}, issueId="123", id=321)
-        mock_jira = Mock(add_worklog=Mock(return_value=mock_worklog))
+    def test_calls_log_work_with_provided_values(self, mock_jira):
+        mock_worklog = SimpleNamespace(raw={"timeSpent": "2h"}, issueId="123", id=321)
+        mock_jira.add_worklog.return_value = mock_worklog
 
         result1 = add_worklog(mock_jira, "333", seconds=7200, date=sentinel.date)
         result2 = add_worklog(mock_jira, "333", seconds=60 * 60 * 2, comment="blah!")
@@ -263,7 +285,9 @@ class TestGetWorklog:
     @patch("dzira.cli.commands.datetime", Mock())
     def test_raises_if_worklog_does_not_match_the_authenticated_user_by_email(self, mocker):
         mock_api = mocker.patch("dzira.cli.commands.api.get_worklog")
-        mock_api.return_value = Mock(author=Mock(emailAddress="bar", displayName="Author"))
+        mock_api.return_value = SimpleNamespace(
+            author=SimpleNamespace(emailAddress="bar", displayName="Author")
+        )
 
         with pytest.raises(Exception) as exc:
             get_worklog(sentinel.jira, issue="123", worklog_id=999, **{"JIRA_EMAIL": "foo"})
@@ -298,7 +322,7 @@ class TestUpdateWorklogPublic:
         assert update_worklog.is_decorated_with_spinner
 
     def test_calls_private_function_and_wraps_the_result(self, mocker):
-        mock_worklog = Mock(id="42")
+        mock_worklog = SimpleNamespace(id="42")
         mock_private = mocker.patch("dzira.cli.commands._update_worklog")
 
         result = update_worklog(mock_worklog, time="3600", comment="blah!", date=None)
@@ -315,14 +339,12 @@ class TestDeleteWorklog:
     def test_is_decorated_correctly(self):
         assert delete_worklog.is_decorated_with_spinner
 
-    @patch.dict(os.environ, {"JIRA_EMAIL": "foo@bar.com"}, clear=True)
     def test_deletes_worklog_and_returns_result(self):
         result = delete_worklog(self.worklog, JIRA_EMAIL="foo@bar.com")
 
         assert isinstance(result, Result)
         self.worklog.delete.assert_called_once()
 
-    @patch.dict(os.environ, {"JIRA_EMAIL": "foo@bar.com"}, clear=True)
     def test_raises_when_worklog_author_does_not_match_configured_user(self):
         with pytest.raises(Exception) as exc_info:
             delete_worklog(self.worklog, JIRA_EMAIL="baz@quux.com")
@@ -358,8 +380,6 @@ class TestCalculateSeconds:
     def test_returns_seconds_delta_of_start_and_now_when_end_is_none(self):
         assert calculate_seconds(D(start="8:00", end=None))["seconds"] == 7 * 60
 
-    @pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python3.9 or higher")
-    @time_machine.travel(datetime.datetime(2023, 11, 23, 8, 7, tzinfo=ZoneInfo("Europe/Warsaw")))
     @pytest.mark.parametrize("start,end", [("2,10", "3.01"), ("2:10", "3h01")])
     def test_accepts_multiple_separators_in_input(self, start, end):
         result = calculate_seconds(D(start=start, end=end))
@@ -397,7 +417,7 @@ class TestGetIssues:
         mock_payload = D(sprint_id=sentinel.id, JIRA_PROJECT_KEY=sentinel.key, state=sentinel.state)
         mock_process_sprint_out.return_value = "output"
         mock_sprint_info = {"a": 1}
-        mock_api.return_value = [Mock(raw={"fields": {"Sprint": [mock_sprint_info]}})]
+        mock_api.return_value = [SimpleNamespace(raw={"fields": {"Sprint": [mock_sprint_info]}})]
 
         result = get_issues(sentinel.jira, mock_payload)
 
@@ -410,6 +430,7 @@ class TestGetIssues:
         )
 
 
+@pytest.mark.xdist_group(name="colors")
 class TestShowIssues:
     def setup_method(self, _):
         status = namedtuple("status", ["name"])
@@ -454,7 +475,9 @@ class TestShowIssues:
         ]
         colors.use = False
 
-    def test_shows_data_extracted_from_jira_issues(self, mock_print, mock_tabulate):
+    def test_shows_data_extracted_from_jira_issues(self, capsys, mock_tabulate):
+        mock_tabulate.return_value = "table"
+
         show_issues(self.sprint_and_issues, format=sentinel.fmt)
 
         mock_tabulate.assert_called_once_with(
@@ -464,7 +487,7 @@ class TestShowIssues:
             maxcolwidths=[None, 35, None, None, None],
             tablefmt=sentinel.fmt
         )
-        mock_print.assert_called_once_with(mock_tabulate.return_value)
+        assert capsys.readouterr().out == "table\n"
 
     @pytest.mark.parametrize("fmt", tabulate.tabulate_formats)
     def test_uses_tabulate_if_format_other_than_csv_or_json(
@@ -505,6 +528,7 @@ class TestShowIssues:
         assert not mock_json.dumps.called
 
 
+@pytest.mark.xdist_group(name="colors")
 class TestSetColorUse:
     @pytest.mark.parametrize(
         "input,isatty,expected",
@@ -535,37 +559,44 @@ class TestSetSpinnerUse:
         assert spinner.use is expected
 
 
-class CliTest:
-    runner = CliRunner()
+@pytest.mark.parametrize(
+    "command,needle",
+    [
+        (cli, "Configure JIRA connection"),
+        (ls, "List issues from the current sprint"),
+        (log, "Log time spent"),
+        (report, "Show work logged for today or for DATE"),
+    ],
+    ids=["cli", "ls", "log", "report"],
+)
+def test_help(runner, command, needle):
+    result = runner.invoke(command, ["--help"])
 
+    assert result.exit_code == 0
+    assert needle in result.output
 
-class TestCli(CliTest):
-    def test_help(self):
-        result = self.runner.invoke(cli, ["--help"])
 
-        assert result.exit_code == 0
-        assert "Configure JIRA connection" in result.output
-
-    def test_by_default_uses_colorful_output(self, mock_set_color_use):
-        result = self.runner.invoke(cli, ["log", "-h"])
+class TestCli:
+    def test_by_default_uses_colorful_output(self, mock_set_color_use, runner):
+        result = runner.invoke(cli, ["log", "-h"])
 
         assert result.exit_code == 0
         mock_set_color_use.assert_called_once_with(True)
 
-    def test_supports_option_to_set_use_color(self, mock_set_color_use):
-        result = self.runner.invoke(cli, ["--no-color", "log", "-h"])
+    def test_supports_option_to_set_use_color(self, mock_set_color_use, runner):
+        result = runner.invoke(cli, ["--no-color", "log", "-h"])
 
         assert result.exit_code == 0
         mock_set_color_use.assert_called_once_with(False)
 
-    def test_by_default_uses_spinner(self, mock_set_spinner_use):
-        result = self.runner.invoke(cli, ["log", "-h"])
+    def test_by_default_uses_spinner(self, mock_set_spinner_use, runner):
+        result = runner.invoke(cli, ["log", "-h"])
 
         assert result.exit_code == 0
         mock_set_spinner_use.assert_called_once_with(True)
 
-    def test_supports_option_to_set_spinner(self, mock_set_spinner_use):
-        result = self.runner.invoke(cli, ["--no-spin", "log", "-h"])
+    def test_supports_option_to_set_spinner(self, mock_set_spinner_use, runner):
+        result = runner.invoke(cli, ["--no-spin", "log", "-h"])
 
         assert result.exit_code == 0
         mock_set_spinner_use.assert_called_once_with(False)
@@ -585,126 +616,112 @@ class TestValidateOutputFormat:
         assert f"format should be one of" in str(exc_info)
 
 
-class TestLs(CliTest):
-    def test_help(self):
-        result = self.runner.invoke(ls, ["--help"])
-
-        assert result.exit_code == 0
-        assert "List issues from the current sprint" in result.output
+class TestLs:
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker):
+        self.mocks = D(
+            mocker.patch.multiple(
+                "dzira.cli.commands",
+                get_config=DEFAULT,
+                get_jira=DEFAULT,
+                get_issues=DEFAULT,
+                show_issues=DEFAULT,
+            )
+        )
+        self.mocks.get_jira.return_value = Result(result=sentinel.jira)
+        self.mocks.get_issues.return_value = Result(result=sentinel.issues)
 
-    def test_happy_run(self, mocker):
+    def test_happy_run(self):
         mock_config = {}
-        mocker.patch("dzira.cli.commands.get_config", return_value=mock_config)
-        mocker.patch("dzira.cli.commands.get_jira", Mock(return_value=Mock(result=sentinel.jira)))
-        mock_get_issues = mocker.patch(
-            "dzira.cli.commands.get_issues", Mock(return_value=Mock(result=sentinel.issues))
-        )
-        mock_show_issues = mocker.patch("dzira.cli.commands.show_issues")
+        self.mocks.get_config.return_value = mock_config
 
-        result = self.runner.invoke(cli, ["--token", "foo", "ls"])
+        with click.Context(ls, obj=mock_config):
+            ls.callback(state="active", sprint_id=None, format=DEFAULT_OUTPUT_FORMAT)
 
-        assert result.exit_code == 0
-        mock_get_issues.assert_called_once_with(
+        self.mocks.get_issues.assert_called_once_with(
             sentinel.jira,
             D(state="active", sprint_id=None, **mock_config)
         )
-        mock_show_issues.assert_called_once_with(sentinel.issues, format=DEFAULT_OUTPUT_FORMAT)
+        self.mocks.show_issues.assert_called_once_with(
+            sentinel.issues, format=DEFAULT_OUTPUT_FORMAT
+        )
 
-    @patch.dict(os.environ, {"JIRA_PROJECT_KEY": "XYZ"}, clear=True)
-    @patch("dzira.cli.commands.get_issues")
-    def test_has_access_to_context_provided_by_cli_group(self, mock_get_issues, mocker):
+    def test_has_access_to_context_provided_by_cli_group(self, runner, monkeypatch):
+        monkeypatch.setenv("JIRA_PROJECT_KEY", "XYZ")
         mock_config = {"JIRA_PROJECT_KEY": "XYZ", "JIRA_EMAIL": "foo@bar.com"}
-        mock_get_config = mocker.patch("dzira.cli.commands.get_config")
-        mocker.patch("dzira.cli.commands.get_jira", Mock(return_value=Mock(result=sentinel.jira)))
 
-        self.runner.invoke(cli, ["--email", "foo@bar.com", "ls"])
+        runner.invoke(cli, ["--email", "foo@bar.com", "ls"])
 
-        mock_get_issues.assert_called_once_with(
-            sentinel.jira, D(state="active", sprint_id=None, **mock_get_config.return_value)
+        self.mocks.get_issues.assert_called_once_with(
+            sentinel.jira,
+            D(state="active", sprint_id=None, **self.mocks.get_config.return_value)
         )
-        mock_get_config.assert_called_once_with(config=mock_config)
+        self.mocks.get_config.assert_called_once_with(config=mock_config)
 
     @pytest.mark.parametrize("state", ["active", "closed", "future"])
-    def test_uses_state_option(self, mocker, state):
-        mock_get_config = mocker.patch("dzira.cli.commands.get_config")
-        mocker.patch("dzira.cli.commands.get_jira", Mock(return_value=Mock(result=sentinel.jira)))
-        mock_get_issues = mocker.patch("dzira.cli.commands.get_issues")
-        mock_get_issues.return_value = Result(result=sentinel.issues)
-        mocker.patch("dzira.cli.commands.show_issues")
+    def test_uses_state_option(self, state, runner):
+        runner.invoke(cli, ["ls", "--state", state], **IN_PROCESS)
 
-        result = self.runner.invoke(cli, ["ls", "--state", state])
-
-        assert result.exit_code == 0
-        mock_get_issues.assert_called_once_with(
-            sentinel.jira, D(state=state, sprint_id=None, **mock_get_config.return_value)
+        self.mocks.get_issues.assert_called_once_with(
+            sentinel.jira, D(state=state, sprint_id=None, **self.mocks.get_config.return_value)
         )
 
-    def test_uses_sprint_id_option(self, mocker):
-        mock_get_config = mocker.patch("dzira.cli.commands.get_config")
-        mocker.patch("dzira.cli.commands.get_jira", Mock(return_value=Mock(result=sentinel.jira)))
-        mock_get_issues = mocker.patch("dzira.cli.commands.get_issues")
-        mock_get_issues.return_value = Result(result=sentinel.issues)
-        mocker.patch("dzira.cli.commands.show_issues")
+    def test_uses_sprint_id_option(self, runner):
+        runner.invoke(cli, ["ls", "--sprint-id", "42"], **IN_PROCESS)
 
-        result = self.runner.invoke(cli, ["ls", "--sprint-id", "42"])
-
-        assert result.exit_code == 0
-        mock_get_issues.assert_called_once_with(
-            sentinel.jira, D(state="active", sprint_id=42, **mock_get_config.return_value)
+        self.mocks.get_issues.assert_called_once_with(
+            sentinel.jira, D(state="active", sprint_id=42, **self.mocks.get_config.return_value)
         )
 
-    def test_supports_tabulate_formats_option(self, mocker):
-        mocker.patch("dzira.cli.commands.get_config")
-        mocker.patch("dzira.cli.commands.get_jira")
-        mock_issues = mocker.patch("dzira.cli.commands.get_issues")
-        mock_show_issues = mocker.patch("dzira.cli.commands.show_issues")
-
-        result = self.runner.invoke(cli, ["ls", "--format", "orgtbl"])
+    def test_supports_tabulate_formats_option(self, runner):
+        runner.invoke(cli, ["ls", "--format", "orgtbl"], **IN_PROCESS)
+
+        self.mocks.show_issues.assert_called_once_with(sentinel.issues, format="orgtbl")
+
+
+TIME_FORMAT_CASES = (
+    # valid
+    ("1h 1m", D(h="1", m="1")),
+    ("1h1m", D(h="1", m="1")),
+    ("1h 59m", D(h="1", m="59")),
+    ("1h59m", D(h="1", m="59")),
+    ("3h1m", D(h="3", m="1")),
+    ("2h", D(h="2", m=None)),
+    ("42m", D(m="42")),
+    ("8h 59", D(h="8", m="59")),
+    # invalid
+    ("9h 1m", D()),
+    ("8 20", D()),
+    ("24h 1m", D()),
+    ("0h 1m", D()),
+    ("1h 0m", D()),
+    ("1h 60m", D()),
+    ("500m", D()),  # more than 8 h (exactly 8h 19m), invalid
+    ("9m", D()),  # less than 10 min, invalid
+)
 
-        assert result.exit_code == 0
-        mock_show_issues.assert_called_once_with(mock_issues.return_value.result, format="orgtbl")
+HOUR_FORMAT_CASES = (
+    ("0:0", True),
+    ("0:59", True),
+    ("0:60", False),
+    ("25:0", False),
+    ("23:1", True),
+    ("10,10", True),
+    ("10.10", True),
+    ("10h10", True),
+    ("12", False),
+)
 
 
 class TestCorrectTimeFormats:
     @pytest.mark.parametrize(
-        "input, expected",
-        [
-            # valid
-            ("1h 1m", D(h="1", m="1")),
-            ("1h1m", D(h="1", m="1")),
-            ("1h 59m", D(h="1", m="59")),
-            ("1h59m", D(h="1", m="59")),
-            ("3h1m", D(h="3", m="1")),
-            ("2h", D(h="2", m=None)),
-            ("42m", D(m="42")),
-            ("8h 59", D(h="8", m="59")),
-            # invalid
-            ("9h 1m", D()),
-            ("8 20", D()),
-            ("24h 1m", D()),
-            ("0h 1m", D()),
-            ("1h 0m", D()),
-            ("1h 60m", D()),
-            ("500m", D()),  # more than 8 h (exactly 8h 19m), invalid
-            ("9m", D()),  # less than 10 min, invalid
-        ],
+        "input, expected", TIME_FORMAT_CASES, ids=[case[0] for case in TIME_FORMAT_CASES]
     )
     def test_evaluates_time_format(self, input, expected):
         assert expected == matches_time_re(input)
 
     @pytest.mark.parametrize(
-        "input, expected",
-        [
-            ("0:0", True),
-            ("0:59", True),
-            ("0:60", False),
-            ("25:0", False),
-            ("23:1", True),
-            ("10,10", True),
-            ("10.10", True),
-            ("10h10", True),
-            ("12", False),
-        ],
+        "input, expected", HOUR_FORMAT_CASES, ids=[case[0] for case in HOUR_FORMAT_CASES]
     )
     def test_evaluates_hour_time_format(self, input, expected):
         assert expected == is_valid_hour(input)
@@ -743,8 +760,7 @@ class TestValidateHour:
         self, mock_is_valid_hour
     ):
         mock_ctx = Mock(params={})
-        mock_param = Mock()
-        type(mock_param).name = PropertyMock(return_value="end")
+        mock_param = SimpleNamespace(name="end")
         with pytest.raises(click.BadParameter) as exc_info:
             validate_hour(mock_ctx, mock_param, "invalid")
 
@@ -752,8 +768,7 @@ class TestValidateHour:
         mock_is_valid_hour.assert_not_called()
 
     def test_passes_when_time_is_none_and_first_check_passed(self, mock_is_valid_hour):
-        mock_param = Mock()
-        type(mock_param).name = PropertyMock(return_value="start")
+        mock_param = SimpleNamespace(name="start")
 
         result = validate_hour(Mock(), mock_param, None)
 
@@ -765,8 +780,7 @@ class TestValidateHour:
             self, mock_is_valid_hour, given_time
     ):
         mock_ctx = Mock(params={"start": "16h42"})
-        mock_param = Mock()
-        type(mock_param).name = PropertyMock(return_value="end")
+        mock_param = SimpleNamespace(name="end")
         mock_is_valid_hour.return_value = True
 
         result = validate_hour(mock_ctx, mock_param, given_time)
@@ -776,8 +790,7 @@ class TestValidateHour:
 
     def test_raises_otherwise(self, mock_is_valid_hour):
         mock_ctx = Mock(params={})
-        mock_param = Mock()
-        type(mock_param).name = PropertyMock(return_value="start")
+        mock_param = SimpleNamespace(name="start")
         mock_is_valid_hour.return_value = False
 
         with pytest.raises(click.BadParameter) as exc_info:
@@ -795,8 +808,7 @@ class TestValidateDate:
         assert validate_date(Mock(), Mock(), None) is None
 
     @pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python3.9 or higher")
-    @time_machine.travel(datetime.datetime(2023, 11, 23, 14, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw")))
-    def test_uses_start_time_when_not_provided_in_date_option(self):
+    def test_uses_start_time_when_not_provided_in_date_option(self, frozen_now):
         mock_ctx = Mock(params={"start": "13:42"})
 
         result = validate_date(mock_ctx, Mock(), "2023-11-23")
@@ -804,8 +816,7 @@ class TestValidateDate:
         assert result == datetime.datetime(2023, 11, 23, 12, 42)
 
     @pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python3.9 or higher")
-    @time_machine.travel(datetime.datetime(2023, 11, 23, 14, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw")))
-    def test_adds_current_time_when_only_date_provided_in_the_option(self):
+    def test_adds_current_time_when_only_date_provided_in_the_option(self, frozen_now):
         result = validate_date(Mock(params={}), Mock(), "2023-11-23")
 
         assert result == datetime.datetime(2023, 11, 23, 13, 0, 0)
@@ -818,23 +829,20 @@ class TestValidateDate:
         assert ", ".join(VALIDATE_DATE_FORMATS) in str(exc_info)
 
     @pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python3.9 or higher")
-    @time_machine.travel(datetime.datetime(2023, 11, 23, 10, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw")))
-    def test_raises_when_date_in_future(self):
+    def test_raises_when_date_in_future(self, frozen_now):
         with pytest.raises(click.BadParameter) as exc_info:
             validate_date(Mock(), Mock(), "2055-11-23T13:42")
 
         assert "worklog date cannot be in future" in str(exc_info)
 
-    @time_machine.travel(datetime.datetime(2023, 11, 23, 10, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw")))
-    def test_raises_when_date_older_than_2_weeks(self):
+    def test_raises_when_date_older_than_2_weeks(self, frozen_now):
         with pytest.raises(click.BadParameter) as exc_info:
             validate_date(Mock(), Mock(), "1055-11-23T13:42")
 
         assert "worklog date cannot be older than 2 weeks" in str(exc_info)
 
     @pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python3.9 or higher")
-    @time_machine.travel(datetime.datetime(2023, 11, 23, 14, 0, 0, tzinfo=ZoneInfo("Europe/Warsaw")))
-    def test_tries_to_convert_date_to_timezone_aware(self):
+    def test_tries_to_convert_date_to_timezone_aware(self, frozen_now):
         result = validate_date(Mock(params={}), Mock(), "2023-11-23T13:42")
 
         assert result == datetime.datetime(2023, 11, 23, 12, 42)
@@ -893,44 +901,44 @@ class TestSanitizeParams:
         assert result == mock_calculate_seconds.return_value
 
 
-@patch("dzira.cli.commands.get_issues")
 class TestEstablishIssue:
     config = {"JIRA_PROJECT_KEY": "XYZ"}
 
-    def test_returns_early_if_issue_is_digits_and_key_provided(
-            self, mock_get_issues,
-    ):
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker):
+        self.mocks = D(mocker.patch.multiple("dzira.cli.commands", get_issues=DEFAULT))
+
+    def test_returns_early_if_issue_is_digits_and_key_provided(self):
         result = establish_issue(Mock(), D(issue="123", **self.config))
 
         assert result == D(issue="XYZ-123", **self.config)
-        mock_get_issues.assert_not_called()
+        self.mocks.get_issues.assert_not_called()
 
-    def test_returns_early_if_issue_is_digits_and_board_not_provided(
-            self, mock_get_sprint_and_issues,
-    ):
-        result = establish_issue(Mock(), D(issue="123", **self.config))
+    @pytest.mark.parametrize("issue", ["ABC-123", "AB_C-12"])
+    def test_returns_early_if_issue_is_full_key(self, issue):
+        result = establish_issue(Mock(), D(issue=issue, **self.config))
 
-        assert result == D(issue="XYZ-123", **self.config)
-        mock_get_sprint_and_issues.assert_not_called()
+        assert result == D(issue=issue, **self.config)
+        self.mocks.get_issues.assert_not_called()
 
-    def test_raises_when_no_matching_issue_in_current_sprint(
-            self, mock_get_issues
-    ):
-        mock_get_issues.return_value = Result(result=D(issues=[]))
+    def test_raises_when_no_matching_issue_in_current_sprint(self):
+        self.mocks.get_issues.return_value = Result(result=D(issues=[]))
 
         with pytest.raises(Exception) as exc_info:
             establish_issue(Mock(), D(issue="some description", **self.config))
 
         assert "could not find any matching issues" in str(exc_info)
 
-    def test_raises_when_more_than_one_matching_issue_in_current_sprint(
-            self, mock_get_issues
-    ):
-        mock_get_issues.return_value = Result(
+    def test_raises_when_more_than_one_matching_issue_in_current_sprint(self):
+        self.mocks.get_issues.return_value = Result(
             result=D(
                 issues=[
-                    Mock(key="1", fields=Mock(summary="I have some description")),
-                    Mock(key="2", fields=Mock(summary="Need some description")),
+                    SimpleNamespace(
+                        key="1", fields=SimpleNamespace(summary="I have some description")
+                    ),
+                    SimpleNamespace(
+                        key="2", fields=SimpleNamespace(summary="Need some description")
+                    ),
                 ]
             )
         )
@@ -940,14 +948,17 @@ class TestEstablishIssue:
 
         assert "found more than one matching issue" in str(exc_info)
 
-    def test_returns_updated_payload_with_issue_key_when_issue_found_in_the_sprint(
-            self, mock_get_issues,
-    ):
-        mock_get_issues.return_value = Result(
+    def test_returns_updated_payload_with_issue_key_when_issue_found_in_the_sprint(self):
+        self.mocks.get_issues.return_value = Result(
             result=D(
                 issues=[
-                    Mock(key="1", fields=Mock(summary="I have some description")),
-                    Mock(key="2", fields=Mock(summary="I don't have any matching phrases")),
+                    SimpleNamespace(
+                        key="1", fields=SimpleNamespace(summary="I have some description")
+                    ),
+                    SimpleNamespace(
+                        key="2",
+                        fields=SimpleNamespace(summary="I don't have any matching phrases"),
+                    ),
                 ]
             )
         )
@@ -957,94 +968,93 @@ class TestEstablishIssue:
         assert result == D(issue="1", **self.config)
 
 
-@patch("dzira.cli.commands.delete_worklog")
-@patch("dzira.cli.commands.add_worklog")
-@patch("dzira.cli.commands.update_worklog")
-@patch("dzira.cli.commands.get_worklog")
 class TestPerformLogAction:
-    def setup_method(self, _):
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker):
         self.payload = D(issue=sentinel.issue, worklog_id=sentinel.worklog, delete_worklog=False)
+        self.mocks = D(
+            mocker.patch.multiple(
+                "dzira.cli.commands",
+                get_worklog=DEFAULT,
+                update_worklog=DEFAULT,
+                add_worklog=DEFAULT,
+                delete_worklog=DEFAULT,
+            )
+        )
 
-    def test_runs_update_worklog_if_worklog_id_provided_but_delete_flag_absent(
-            self, mock_get_worklog, mock_update_worklog, mock_add_worklog, mock_delete_worklog
-    ):
+    def test_runs_update_worklog_if_worklog_id_provided_but_delete_flag_absent(self):
         perform_log_action(sentinel.jira, self.payload)
 
-        mock_get_worklog.assert_called_once_with(
+        self.mocks.get_worklog.assert_called_once_with(
             sentinel.jira, issue=sentinel.issue, worklog_id=sentinel.worklog, delete_worklog=False
         )
-        mock_update_worklog.assert_called_once_with(
-            mock_get_worklog.return_value.result,
+        self.mocks.update_worklog.assert_called_once_with(
+            self.mocks.get_worklog.return_value.result,
             **self.payload
         )
-        assert not mock_add_worklog.called
-        assert not mock_delete_worklog.called
+        assert not self.mocks.add_worklog.called
+        assert not self.mocks.delete_worklog.called
 
-    def test_runs_delete_worklog_if_worklog_id_provided_with_delete_flag(
-            self, mock_get_worklog, mock_update_worklog, mock_add_worklog, mock_delete_worklog
-    ):
+    def test_runs_delete_worklog_if_worklog_id_provided_with_delete_flag(self):
         self.payload.update(delete_worklog=True)
 
         perform_log_action(sentinel.jira, self.payload)
 
-        mock_get_worklog.assert_called_once_with(
+        self.mocks.get_worklog.assert_called_once_with(
             sentinel.jira, issue=sentinel.issue, worklog_id=sentinel.worklog, delete_worklog=True
         )
-        mock_delete_worklog.assert_called_once_with(
-            mock_get_worklog.return_value.result,
+        self.mocks.delete_worklog.assert_called_once_with(
+            self.mocks.get_worklog.return_value.result,
             **self.payload
         )
-        assert not mock_add_worklog.called
-        assert not mock_update_worklog.called
+        assert not self.mocks.add_worklog.called
+        assert not self.mocks.update_worklog.called
 
-    def test_runs_add_worklog_if_worklog_id_not_provided(
-            self, mock_get_worklog, mock_update_worklog, mock_add_worklog, mock_delete_worklog
-    ):
+    def test_runs_add_worklog_if_worklog_id_not_provided(self):
         self.payload.update(worklog_id=None)
 
         perform_log_action(sentinel.jira, self.payload)
 
-        mock_get_worklog.assert_not_called()
-        mock_add_worklog.assert_called_once_with(sentinel.jira, **self.payload)
-        assert not mock_delete_worklog.called
-        assert not mock_update_worklog.called
-
-
-class TestLog(CliTest):
-    def test_help(self):
-        result = self.runner.invoke(log, ["--help"])
-
-        assert "Log time spent" in result.output
-
-    def test_runs_stuff_in_order(self, mocker):
-        mocker.patch.dict(
-            os.environ, {"JIRA_TOKEN": "token", "JIRA_EMAIL": "email"}, clear=True
+        self.mocks.get_worklog.assert_not_called()
+        self.mocks.add_worklog.assert_called_once_with(sentinel.jira, **self.payload)
+        assert not self.mocks.delete_worklog.called
+        assert not self.mocks.update_worklog.called
+
+
+class TestLog:
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker):
+        self.mocks = D(
+            mocker.patch.multiple(
+                "dzira.cli.commands",
+                sanitize_params=DEFAULT,
+                get_config=DEFAULT,
+                get_jira=DEFAULT,
+                establish_issue=DEFAULT,
+                perform_log_action=DEFAULT,
+            )
         )
-        mock_sanitize_params = mocker.patch("dzira.cli.commands.sanitize_params")
-        mock_get_config = mocker.patch("dzira.cli.commands.get_config")
-        mock_get_jira = mocker.patch("dzira.cli.commands.get_jira")
-        mock_establish_issue = mocker.patch("dzira.cli.commands.establish_issue")
-        mock_perform_log_action = mocker.patch("dzira.cli.commands.perform_log_action")
 
-        mock_jira = mock_get_jira.return_value.result
-        mock_config = mock_get_config.return_value
+    def test_runs_stuff_in_order(self):
+        mock_jira = self.mocks.get_jira.return_value.result
+        mock_config = self.mocks.get_config.return_value
+        mock_payload = self.mocks.sanitize_params.return_value
 
-        result = self.runner.invoke(cli, ["log", "123", "-t", "2h"])
+        with click.Context(log, obj={"JIRA_TOKEN": "token", "JIRA_EMAIL": "email"}) as ctx:
+            ctx.params = {"issue": "123", "time": "2h"}
+            log.callback(**ctx.params)
 
-        assert result.exit_code == 0
-        mock_sanitize_params.assert_called_once()
-        mock_get_config.assert_called_once_with(
+        self.mocks.sanitize_params.assert_called_once_with(D(issue="123", time="2h"))
+        self.mocks.get_config.assert_called_once_with(
             config=dict(JIRA_TOKEN="token", JIRA_EMAIL="email"),
         )
-        mock_get_jira.assert_called_once_with(mock_config)
-        mock_establish_issue.assert_called_once_with(
-            mock_jira, mock_sanitize_params.return_value.update.return_value
-        )
-        mock_sanitize_params.return_value.update.assert_called_once_with(
-            **mock_get_config.return_value
+        self.mocks.get_jira.assert_called_once_with(mock_config)
+        self.mocks.establish_issue.assert_called_once_with(
+            mock_jira, mock_payload.update.return_value
         )
-        mock_perform_log_action.assert_called_once_with(
-            mock_jira, mock_establish_issue.return_value
+        mock_payload.update.assert_called_once_with(**mock_config)
+        self.mocks.perform_log_action.assert_called_once_with(
+            mock_jira, self.mocks.establish_issue.return_value
         )
 
 
@@ -1052,8 +1062,7 @@ class TestGetUser:
     def test_is_decorated_correctly(self):
         assert get_user_id.is_decorated_with_spinner
 
-    def test_uses_api_and_returns_correct_data(self, mocker):
-        mock_jira = Mock()
+    def test_uses_api_and_returns_correct_data(self, mocker, mock_jira):
         mock_api = mocker.patch("dzira.cli.commands.api.get_current_user_id")
 
         result = get_user_id(mock_jira)
@@ -1091,8 +1100,12 @@ class TestGetIssuesWithWorkLoggedOnDate:
 @patch("dzira.cli.commands.api.get_issue_worklogs_by_user_and_date")
 class TestGetUserWorklogsFromDate:
     def setup_method(self, _):
-        self.issue1 = Mock(id=1, key="Issue-1", fields=Mock(summary="Foo bar"))
-        self.issue2 = Mock(id=2, key="Issue-2", fields=Mock(summary="Baz quux"))
+        self.issue1 = SimpleNamespace(
+            id=1, key="Issue-1", fields=SimpleNamespace(summary="Foo bar")
+        )
+        self.issue2 = SimpleNamespace(
+            id=2, key="Issue-2", fields=SimpleNamespace(summary="Baz quux")
+        )
         self.issues = [self.issue1, self.issue2]
 
     def test_is_decorated_correctly(self, _):
@@ -1107,13 +1120,17 @@ class TestGetUserWorklogsFromDate:
             Result(result=self.issues, data=D(report_date=report_date))
         )
 
-        assert mock_api.call_args_list == [
-            call(sentinel.jira, self.issue1, sentinel.email, report_date),
-            call(sentinel.jira, self.issue2, sentinel.email, report_date)
-        ]
+        assert mock_api.call_count == 2
+        mock_api.assert_has_calls(
+            [
+                call(sentinel.jira, self.issue1, sentinel.email, report_date),
+                call(sentinel.jira, self.issue2, sentinel.email, report_date)
+            ],
+            any_order=True
+        )
 
     def test_returns_mapping_of_issue_to_worklogs(self, mock_api):
-        mock_api.side_effect = [[sentinel.worklog1], []]
+        mock_api.side_effect = lambda _, issue, *__: [sentinel.worklog1] if issue.id == 1 else []
 
         result = get_user_worklogs_from_date(
             sentinel.jira,
@@ -1126,6 +1143,44 @@ class TestGetUserWorklogsFromDate:
         )
         assert "Found 1 worklog" in result.stdout
 
+    def test_filters_embedded_worklogs_without_threads(self, mock_api, mocker):
+        mock_executor = mocker.patch("dzira.cli.commands.concurrent.futures.ThreadPoolExecutor")
+
+        get_user_worklogs_from_date(
+            sentinel.jira,
+            sentinel.email,
+            Result(result=self.issues, data=D(report_date=datetime.datetime(2023, 11, 26, 0, 0)))
+        )
+
+        mock_executor.assert_not_called()
+        assert mock_api.call_count == 2
+
+    def test_requests_only_issues_with_more_worklogs_than_embedded_in_threads(
+            self, mock_api, mocker
+    ):
+        requested = [
+            SimpleNamespace(
+                id=i,
+                key=f"Issue-{i}",
+                fields=SimpleNamespace(summary="", worklog=SimpleNamespace(worklogs=20 * [None])),
+            )
+            for i in (3, 4)
+        ]
+        spy_map = mocker.spy(concurrent.futures.ThreadPoolExecutor, "map")
+
+        get_user_worklogs_from_date(
+            sentinel.jira,
+            sentinel.email,
+            Result(
+                result=self.issues + requested,
+                data=D(report_date=datetime.datetime(2023, 11, 26, 0, 0))
+            )
+        )
+
+        spy_map.assert_called_once()
+        assert list(spy_map.call_args.args[2]) == requested
+        assert mock_api.call_count == 4
+
 
 class TestSecondsToHourMinutFmt:
     @pytest.mark.parametrize(
@@ -1142,29 +1197,53 @@ class TestSecondsToHourMinutFmt:
         assert _seconds_to_hour_minute_fmt(input) == expected
 
 
+class TestParseJiraTimestamp:
+    @pytest.mark.parametrize(
+        "input",
+        [
+            "2023-11-26T13:42:16.000+0100",
+            "2023-11-26T13:42:16.123-0530",
+            "2023-11-26T13:42:16.123456+0000",
+            "2023-11-26T13:42:16.1+01:00",
+        ]
+    )
+    def test_parses_same_as_strptime(self, input):
+        expected = datetime.datetime.strptime(input, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+        result = _parse_jira_timestamp(input)
+
+        assert result == expected
+        assert result.utcoffset() == expected.utcoffset()
+
+    def test_raises_when_timestamp_invalid(self):
+        with pytest.raises(ValueError):
+            _parse_jira_timestamp("2023-11-26 13:42")
+
+
+@pytest.mark.xdist_group(name="colors")
 class TestShowReport:
     def setup_method(self, _):
         os.environ["TZ"] = "UTC"
         time.tzset()
-        self.user = Mock(accountId="123")
-        self.worklog1 = Mock(
+        self.user = SimpleNamespace(accountId="123")
+        self.worklog1 = SimpleNamespace(
             raw={
                 "started": "2023-11-26T13:42:16.000+0100",
                 "timeSpent": "30m",
                 "comment": "task a",
                 "timeSpentSeconds": 30 * 60,
             },
-            author=Mock(accountId="123"),
+            author=SimpleNamespace(accountId="123"),
             id="1"
         )
-        self.worklog2 = Mock(
+        self.worklog2 = SimpleNamespace(
             raw={
-                "started":"2023-11-26T15:42:00.000+0100",
+                "started": "2023-11-26T15:42:00.000+0100",
                 "timeSpent": "1h 15m",
                 "comment": "task b",
                 "timeSpentSeconds": (60 * 60) + (15 * 60),
             },
-            author=Mock(accountId="123"),
+            author=SimpleNamespace(accountId="123"),
             id="2"
         )
         self.worklogs_of_issues = D(
@@ -1175,29 +1254,23 @@ class TestShowReport:
         )
 
     def test_uses_tabulate_to_show_the_report_with_worklog_id_timestamp_timespent_and_comment(
-            self, mock_tabulate, mock_print, mock_csv, mock_json
+            self, capsys, mock_tabulate, mock_csv, mock_json
     ):
-        mock_tabulate.side_effect = [sentinel.t1, sentinel.t2]
+        mock_tabulate.side_effect = ["table 1", "table 2"]
         show_report(self.worklogs_of_issues, format="table")
 
         assert mock_tabulate.call_args_list == [
             call([["[1]", "12:42:16", ":   30m", "task a"]], maxcolwidths=[None, None, None, 60]),
             call([["[2]", "14:42:00", ":1h 15m", "task b"]], maxcolwidths=[None, None, None, 60])
         ]
-        mock_print.assert_has_calls(
-            [
-                call(c("^bold", "[XY-1] issue 1 ", "^cyan", "(0h 30m)")),
-                call(sentinel.t1),
-                call(c("^bold", "[XY-2] issue 2 ", "^cyan", "(1h 15m)")),
-                call(sentinel.t2)
-             ],
-            any_order=True
-        )
-        assert not mock_csv.DictWriter.called
+        out = capsys.readouterr().out
+        assert c("^bold", "[XY-1] issue 1 ", "^cyan", "(0h 30m)") + "\ntable 1\n" in out
+        assert c("^bold", "[XY-2] issue 2 ", "^cyan", "(1h 15m)") + "\ntable 2\n" in out
+        assert not mock_csv.writer.called
         assert not mock_json.dumps.called
 
     def test_prints_data_in_csv_format(
-            self, mock_csv, mock_print, mock_json, mock_tabulate
+            self, capsys, mock_csv, mock_json, mock_tabulate
     ):
         show_report(self.worklogs_of_issues, format="csv")
 
@@ -1206,18 +1279,18 @@ class TestShowReport:
             ["XY-1", "issue 1", "1", "12:42:16", "30m", 30 * 60, "task a"],
             ["XY-2", "issue 2", "2", "14:42:00", "1h 15m", (60 * 60) + (15 * 60), "task b"]
         ]
-        mock_csv.DictWriter.assert_called_once_with(sys.stdout, fieldnames=headers)
-        mock_csv.DictWriter.return_value.writeheader.assert_called_once()
-        mock_csv.DictWriter.return_value.writerows.assert_called_once_with(
-            [dict(zip(headers, w)) for w in processed_worklogs]
-        )
+        mock_csv.writer.assert_called_once_with(sys.stdout)
+        mock_csv.writer.return_value.writerow.assert_called_once_with(headers)
+        mock_csv.writer.return_value.writerows.assert_called_once_with(processed_worklogs)
         assert not mock_tabulate.called
         assert not mock_json.dumps.called
-        assert not mock_print.called
+        assert capsys.readouterr().out == ""
 
     def test_prints_data_in_json_format(
-            self, mock_csv, mock_print, mock_json, mock_tabulate
+            self, capsys, mock_csv, mock_json, mock_tabulate
     ):
+        mock_json.dumps.return_value = "{}"
+
         show_report(self.worklogs_of_issues, format="json")
 
         processed_worklogs = {
@@ -1257,115 +1330,73 @@ class TestShowReport:
             "total_seconds": (30 * 60) + (60 * 60) + (15 * 60)
         }
         mock_json.dumps.assert_called_once_with(processed_worklogs)
-        mock_print.assert_called_once_with(mock_json.dumps.return_value)
-        assert not mock_csv.DictWriter.called
+        assert capsys.readouterr().out == "{}\n"
+        assert not mock_csv.writer.called
         assert not mock_tabulate.called
 
 
-class TestReport(CliTest):
-    def test_help(self):
-        result = self.runner.invoke(report, ["--help"])
-
-        assert "Show work logged for today or for DATE" in result.output
-
-    @patch("dzira.cli.commands.show_report")
-    @patch("dzira.cli.commands.get_user_worklogs_from_date")
-    @patch("dzira.cli.commands.get_issues_with_work_logged_on_date")
-    @patch("dzira.cli.commands.get_jira")
-    @patch("dzira.cli.commands.get_config")
-    def test_runs_stuff_in_order(
-            self,
-            mock_get_config,
-            mock_get_jira,
-            mock_get_issues_with_work_logged_on_date,
-            mock_get_user_worklogs_from_date,
-            mock_show_report
-    ):
-        mock_config = mock_get_config.return_value = {
+class TestReport:
+    @pytest.fixture(autouse=True)
+    def setup(self, mocker):
+        self.mocks = D(
+            mocker.patch.multiple(
+                "dzira.cli.commands",
+                get_config=DEFAULT,
+                get_jira=DEFAULT,
+                get_issues_with_work_logged_on_date=DEFAULT,
+                get_user_worklogs_from_date=DEFAULT,
+                show_report=DEFAULT,
+            )
+        )
+        self.mocks.get_config.return_value = {
             "JIRA_EMAIL": sentinel.email, "JIRA_PROJECT_KEY": sentinel.project_key
         }
-        mock_jira = mock_get_jira.return_value.result
 
-        result = self.runner.invoke(report, ["--date", "2023-11-26"])
+    def test_runs_stuff_in_order(self, runner):
+        mock_config = self.mocks.get_config.return_value
+        mock_jira = self.mocks.get_jira.return_value.result
 
-        assert result.exit_code == 0
+        runner.invoke(report, ["--date", "2023-11-26"], **IN_PROCESS)
 
-        mock_get_config.assert_called_once()
-        mock_get_jira.assert_called_once_with(mock_config)
-        mock_get_issues_with_work_logged_on_date.assert_called_once_with(
+        self.mocks.get_config.assert_called_once()
+        self.mocks.get_jira.assert_called_once_with(mock_config)
+        self.mocks.get_issues_with_work_logged_on_date.assert_called_once_with(
             mock_jira,
             sentinel.project_key,
             datetime.datetime(2023, 11, 26, 0, 0)
         )
-        mock_get_user_worklogs_from_date.assert_called_once_with(
+        self.mocks.get_user_worklogs_from_date.assert_called_once_with(
             mock_jira,
             sentinel.email,
-            mock_get_issues_with_work_logged_on_date.return_value
+            self.mocks.get_issues_with_work_logged_on_date.return_value
         )
-        mock_show_report.assert_called_once_with(
-            mock_get_user_worklogs_from_date.return_value.result,
+        self.mocks.show_report.assert_called_once_with(
+            self.mocks.get_user_worklogs_from_date.return_value.result,
             format="table"
         )
 
-    @patch("dzira.cli.commands.get_jira", Mock(return_value=Mock(result=sentinel.jira)))
-    @patch("dzira.cli.commands.get_config")
-    @patch("dzira.cli.commands.show_report")
-    @patch("dzira.cli.commands.get_user_worklogs_from_date")
-    @patch("dzira.cli.commands.get_issues_with_work_logged_on_date")
-    def test_runs_show_report_with_empty_dict_when_no_worklogs_found(
-            self,
-            mock_get_issues_with_work_logged_on_date,
-            mock_get_user_worklogs_from_date,
-            mock_show_report,
-            mock_get_config
-    ):
-        mock_get_config.return_value = {"JIRA_EMAIL": "email", "JIRA_PROJECT_KEY": "key"}
-        mock_get_issues_with_work_logged_on_date.return_value = Result()
+    def test_runs_show_report_with_empty_dict_when_no_worklogs_found(self, runner):
+        self.mocks.get_issues_with_work_logged_on_date.return_value = Result()
 
-        self.runner.invoke(report, ["--date", "2023-11-26"])
+        runner.invoke(report, ["--date", "2023-11-26"])
 
-        assert not mock_get_user_worklogs_from_date.called
-        mock_show_report.assert_called_once_with(D(), format="table")
+        assert not self.mocks.get_user_worklogs_from_date.called
+        self.mocks.show_report.assert_called_once_with(D(), format="table")
 
     @pytest.mark.parametrize("fmt", ["csv", "json", "table"])
-    @patch("dzira.cli.commands.get_jira", Mock(return_value=Mock(result=Mock())))
-    @patch(
-        "dzira.cli.commands.get_issues_with_work_logged_on_date",
-        Mock(return_value=Result(result=Mock()))
-    )
-    @patch(
-        "dzira.cli.commands.get_user_worklogs_from_date",
-        Mock(return_value=Result(result=sentinel.worklogs))
-    )
-    @patch("dzira.cli.commands.get_config")
-    @patch("dzira.cli.commands.show_report")
-    def test_accepts_format_option(self, mock_show_report, mock_get_config, fmt):
-        mock_get_config.return_value = {"JIRA_EMAIL": "email", "JIRA_PROJECT_KEY": "key"}
+    def test_accepts_format_option(self, fmt, runner):
+        self.mocks.get_user_worklogs_from_date.return_value = Result(result=sentinel.worklogs)
 
-        result = self.runner.invoke(report, ["--format", fmt])
+        runner.invoke(report, ["--format", fmt], **IN_PROCESS)
 
-        assert result.exit_code == 0
-        mock_show_report.assert_called_once_with(sentinel.worklogs, format=fmt)
-
-    @patch("dzira.cli.commands.get_jira", Mock(return_value=Mock(result=sentinel.jira)))
-    @patch("dzira.cli.commands.get_config", Mock(return_value=Mock(result=Mock())))
-    @patch("dzira.cli.commands.show_report")
-    @patch("dzira.cli.commands.get_user_worklogs_from_date")
-    @patch("dzira.cli.commands.get_issues_with_work_logged_on_date")
-    def test_raises_when_wrong_format_option(
-            self,
-            mock_get_issues_with_work_logged_on_date,
-            mock_get_user_worklogs_from_date,
-            mock_show_report,
-    ):
-        mock_get_issues_with_work_logged_on_date.return_value = Result(result=[sentinel.issue])
-        mock_worklogs = [Mock()]
-        mock_get_user_worklogs_from_date.return_value = Result(result=mock_worklogs)
+        self.mocks.show_report.assert_called_once_with(sentinel.worklogs, format=fmt)
 
-        result = self.runner.invoke(report, ["--format", "foo"])
+    def test_raises_when_wrong_format_option(self, runner):
+        result = runner.invoke(report, ["--format", "foo"])
 
         assert result.exit_code == 2
-        assert not mock_show_report.called
+        assert not self.mocks.get_config.called
+        assert not self.mocks.show_report.called
 
 
 class TestMain:
@@ -1376,7 +1407,7 @@ class TestMain:
 
         mock_cli.assert_called_once()
 
-    def test_catches_exceptions_and_exits(self, mocker, mock_print):
+    def test_catches_exceptions_and_exits(self, mocker, capsys):
         mocker.patch("dzira.cli.commands.hide_cursor")
         mocker.patch("dzira.cli.commands.show_cursor")
         mock_cli = mocker.patch("dzira.cli.commands.cli")
@@ -1386,7 +1417,7 @@ class TestMain:
 
         main()
 
-        mock_print.assert_called_once_with(exc, file=sys.stderr)
+        assert capsys.readouterr().err == "foo\n"
         mock_exit.assert_called_once_with(1)
 
     def test_hides_and_shows_the_cursor_when_in_interactive_shell(self, mocker, mock_isatty):
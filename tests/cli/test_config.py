@@ -1,5 +1,6 @@
 import os
-from unittest.mock import call, patch, sentinel
+from types import MappingProxyType
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -7,33 +8,64 @@ from src.dzira.betterdict import D
 from src.dzira.cli.config import (
     CONFIG_DIR_NAME,
     DOTFILE,
+    _config_file_cache,
+    _default_config_path,
+    _dotenv_cache,
     get_config,
     get_config_from_file,
 )
 
 
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    _config_file_cache.clear()
+    _dotenv_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def config_values():
+    return MappingProxyType(
+        {
+            "JIRA_SERVER": "foo.bar.com",
+            "JIRA_EMAIL": "name@example.com",
+            "JIRA_TOKEN": "asdf1234",
+            "JIRA_PROJECT_KEY": "XYZ",
+        }
+    )
+
+
 @pytest.fixture
-def config(mocker):
-    mock_dotenv_values = mocker.patch("src.dzira.cli.config.dotenv_values")
-    mock_dotenv_values.return_value = {
-        "JIRA_SERVER": "foo.bar.com",
-        "JIRA_EMAIL": "name@example.com",
-        "JIRA_TOKEN": "asdf1234",
-        "JIRA_PROJECT_KEY": "XYZ",
-    }
+def config(monkeypatch, config_values):
+    mock_dotenv_values = Mock(return_value=config_values)
+    monkeypatch.setattr("src.dzira.cli.config.dotenv_values", mock_dotenv_values)
     return mock_dotenv_values
 
 
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / DOTFILE
+    path.write_text("JIRA_PROJECT_KEY=XYZ\n")
+    return path
+
+
+def parsed_files(mock_dotenv_values):
+    return [c.kwargs["stream"].name for c in mock_dotenv_values.call_args_list]
+
+
 class TestGetConfigFromFile:
     def test_looks_for_config_file_in_default_locations_when_path_not_provided(
-            self, mocker, config
+            self, mocker, monkeypatch
     ):
-        mocker.patch.dict(os.environ, {"HOME": "/home/foo"}, clear=True)
+        monkeypatch.setenv("HOME", "/home/foo")
         mock_env_get = mocker.patch("src.dzira.cli.config.os.environ.get")
         mock_os_path = mocker.patch("src.dzira.cli.config.os.path")
-        mock_dotenv_values = config
 
-        get_config_from_file()
+        result = _default_config_path()
 
         mock_env_get.assert_called_once_with("XDG_CONFIG_HOME", "/home/foo")
         assert mock_os_path.join.call_args_list == [
@@ -42,36 +74,102 @@ class TestGetConfigFromFile:
             call(os.environ["HOME"], ".config", CONFIG_DIR_NAME, "env"),
             call(os.environ["HOME"], ".config", DOTFILE)
         ]
-        mock_dotenv_values.assert_called_once()
+        assert result == mock_os_path.join.return_value
+
+    def test_picks_up_first_matching_path_when_no_file_provided(
+            self, monkeypatch, config, config_file
+    ):
+        monkeypatch.setenv("HOME", str(config_file.parent))
+        mock_dotenv_values = config
+
+        result = get_config_from_file()
 
-    def test_picks_up_first_matching_path_when_no_file_provided(self, mocker, config):
-        mocker.patch.dict(os.environ, {"HOME": "/home/foo"}, clear=True)
-        mock_os_path_isfile = mocker.patch("src.dzira.cli.config.os.path.isfile")
-        mock_os_path_isfile.side_effect = [False, True]
+        assert result == mock_dotenv_values.return_value
+        assert parsed_files(mock_dotenv_values) == [str(config_file)]
+
+    def test_resolves_default_path_again_when_home_changes(self, monkeypatch, config, tmp_path):
+        homes = [tmp_path / "foo", tmp_path / "bar"]
+        for home in homes:
+            home.mkdir()
+            (home / DOTFILE).write_text("JIRA_PROJECT_KEY=XYZ\n")
+        mock_dotenv_values = config
+
+        for home in homes[:1] + homes:
+            monkeypatch.setenv("HOME", str(home))
+            get_config_from_file()
+
+        assert parsed_files(mock_dotenv_values) == [str(home / DOTFILE) for home in homes]
+
+    def test_finds_default_config_file_created_after_failed_lookup(
+            self, monkeypatch, config, tmp_path
+    ):
+        monkeypatch.setenv("HOME", str(tmp_path))
         mock_dotenv_values = config
 
+        assert get_config_from_file() == {}
+        (tmp_path / DOTFILE).write_text("JIRA_PROJECT_KEY=XYZ\n")
         get_config_from_file()
 
-        mock_dotenv_values.assert_called_once_with(f"/home/foo/{DOTFILE}")
+        assert parsed_files(mock_dotenv_values) == [str(tmp_path / DOTFILE)]
 
-    def test_looks_for_config_file_in_provided_location(self, config):
+    def test_looks_for_config_file_in_provided_location(self, config, config_file):
         mock_dotenv_values = config
 
-        get_config_from_file(sentinel.path)
+        result = get_config_from_file(config_file)
 
-        mock_dotenv_values.assert_called_once_with(sentinel.path)
+        assert result == mock_dotenv_values.return_value
+        assert parsed_files(mock_dotenv_values) == [str(config_file)]
 
-    def test_returns_empty_dict_when_no_file_found(self, mocker):
-        mocker.patch("src.dzira.cli.config.os.path.isfile", lambda _: False)
+    def test_parses_values_from_provided_file(self, config_file):
+        assert get_config_from_file(str(config_file)) == {"JIRA_PROJECT_KEY": "XYZ"}
+
+    def test_reuses_parsed_config_file(self, config, config_file):
+        mock_dotenv_values = config
+
+        result1 = get_config_from_file(config_file)
+        result2 = get_config_from_file(config_file)
+
+        assert result1 == result2 == mock_dotenv_values.return_value
+        mock_dotenv_values.assert_called_once()
+
+    def test_parses_config_file_again_when_it_was_modified(self, config, config_file):
+        mock_dotenv_values = config
+
+        get_config_from_file(config_file)
+        get_config_from_file(config_file)
+        mtime = config_file.stat().st_mtime
+        os.utime(config_file, (mtime + 10, mtime + 10))
+        get_config_from_file(config_file)
+
+        assert parsed_files(mock_dotenv_values) == 2 * [str(config_file)]
+
+    def test_returns_empty_dict_when_provided_file_does_not_exist(self, config, tmp_path):
+        mock_dotenv_values = config
+
+        result = get_config_from_file(tmp_path / "no-such-file")
+
+        assert result == {}
+        mock_dotenv_values.assert_not_called()
+
+    def test_returns_empty_dict_when_no_file_found(self, monkeypatch):
+        monkeypatch.setattr("src.dzira.cli.config.os.path.isfile", lambda _: False)
 
         result = get_config_from_file()
 
         assert result == {}
 
 
-@patch("src.dzira.cli.config.REQUIRED_KEYS", ("FOO", "BAR", "BAZ"))
-@patch("src.dzira.cli.config.get_config_from_file")
 class TestGetConfig:
+    @pytest.fixture(autouse=True)
+    def required_keys(self, monkeypatch):
+        monkeypatch.setattr("src.dzira.cli.config.REQUIRED_KEYS", ("FOO", "BAR", "BAZ"))
+
+    @pytest.fixture
+    def mock_config_from_file(self, monkeypatch):
+        mock = Mock()
+        monkeypatch.setattr("src.dzira.cli.config.get_config_from_file", mock)
+        return mock
+
     def test_uses_user_provided_values_entirely(self, mock_config_from_file):
         override_conf = D({"FOO": "123", "BAR": "abc", "BAZ": "zab"})
 
@@ -102,6 +200,31 @@ class TestGetConfig:
         )
         mock_config_from_file.assert_called_once_with("/path/to/file")
 
+    def test_picks_up_changes_to_provided_file_between_calls(self, tmp_path):
+        config_file = tmp_path / "env"
+        config_file.write_text("FOO=123\nBAR=abc\nBAZ=OLD\n")
+
+        result1 = get_config({"file": str(config_file)})
+        config_file.write_text("FOO=123\nBAR=abc\nBAZ=NEW\n")
+        mtime = config_file.stat().st_mtime
+        os.utime(config_file, (mtime + 10, mtime + 10))
+        result2 = get_config({"file": str(config_file)})
+
+        assert result1.BAZ == "OLD"
+        assert result2.BAZ == "NEW"
+
+    def test_parses_provided_file_only_when_it_was_modified(self, config, config_file):
+        mock_dotenv_values = config
+        mock_dotenv_values.return_value = {"FOO": "123", "BAR": "abc", "BAZ": "zab"}
+
+        get_config({"file": str(config_file)})
+        get_config({"file": str(config_file)})
+        mtime = config_file.stat().st_mtime
+        os.utime(config_file, (mtime + 10, mtime + 10))
+        get_config({"file": str(config_file)})
+
+        assert parsed_files(mock_dotenv_values) == 2 * [str(config_file)]
+
     def test_raises_when_required_values_not_found_in_compiled_config(
         self, mock_config_from_file
     ):
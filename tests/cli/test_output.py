@@ -15,18 +15,20 @@ from src.dzira.cli.output import (
 )
 
 
+COLOR_CASES = (
+    ("^bold", "\033[1m\033[0m"),
+    ("^red", "\033[91m\033[0m"),
+    ("^green", "\033[92m\033[0m"),
+    ("^yellow", "\033[93m\033[0m"),
+    ("^blue", "\033[94m\033[0m"),
+    ("^magenta", "\033[95m\033[0m"),
+    ("^cyan", "\033[96m\033[0m"),
+)
+
+
 class TestColors:
     @pytest.mark.parametrize(
-        "test_input,expected",
-        [
-            ("^bold", "\033[1m\033[0m"),
-            ("^red", "\033[91m\033[0m"),
-            ("^green", "\033[92m\033[0m"),
-            ("^yellow", "\033[93m\033[0m"),
-            ("^blue", "\033[94m\033[0m"),
-            ("^magenta", "\033[95m\033[0m"),
-            ("^cyan", "\033[96m\033[0m"),
-         ]
+        "test_input,expected", COLOR_CASES, ids=[case[0] for case in COLOR_CASES]
     )
     def test_uses_right_codes_for_given_colors(self, test_input, expected):
         assert Colors().c(test_input) == expected
@@ -81,6 +83,14 @@ class TestResult:
         assert result.result == sentinel.result
         assert result.stdout == "foo"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="requires python3.10 or higher")
+    def test_uses_slots_instead_of_instance_dict(self):
+        result = Result()
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.foo = "bar"
+
 
 class TestSpinner:
     def test_is_initialized_properly(self):
@@ -1,5 +1,6 @@
 import os
 import time
+from collections import namedtuple
 from datetime import datetime
 from unittest.mock import Mock, sentinel
 
@@ -19,10 +20,17 @@ from dzira.api import (
     get_sprints_by_board,
     get_worklog,
     log_work,
+    needs_worklogs_request,
     search_issues_with_sprint_info,
 )
 
 
+Author = namedtuple("Author", "emailAddress")
+Board = namedtuple("Board", "id raw")
+Sprint = namedtuple("Sprint", "id name")
+Worklog = namedtuple("Worklog", "started raw author")
+
+
 # fixtures:
 
 @pytest.fixture()
@@ -37,12 +45,12 @@ def mock_jira(mocker):
 
 @pytest.fixture
 def mock_board():
-    return Mock(id=sentinel.board_id)
+    return Board(id=sentinel.board_id, raw={})
 
 
 @pytest.fixture
 def mock_sprint():
-    return Mock(id=sentinel.id, name="SprintName")
+    return Sprint(id=sentinel.id, name="SprintName")
 
 
 # tests
@@ -65,8 +73,8 @@ def test_get_board_by_key_happy_path(mock_jira):
 
 def test_get_board_by_key_raises_when_more_than_one_board_found(mock_jira):
     mock_jira.boards.return_value = [
-        Mock(raw={"location": {"displayName": "board1"}}),
-        Mock(raw={"location": {"displayName": "board2"}})
+        Board(id=1, raw={"location": {"displayName": "board1"}}),
+        Board(id=2, raw={"location": {"displayName": "board2"}})
     ]
 
     with pytest.raises(Exception) as exc:
@@ -194,41 +202,41 @@ def test_get_issue_worklogs_by_user_and_date_from_the_issue(mock_jira):
     email_address = "foo@bar"
     report_date = datetime(2023, 11, 26, 0, 0).astimezone()
 
-    worklog1 = Mock(
+    worklog1 = Worklog(
         started="2023-11-26T13:42:16.000-0600",
         raw={
             "timeSpent": "30m",
             "comment": "ONLY ONE MATCHING",
             "timeSpentSeconds": 30 * 60,
         },
-        author=Mock(emailAddress="foo@bar")
+        author=Author(emailAddress="foo@bar")
     )
-    worklog2 = Mock(
+    worklog2 = Worklog(
         started="2023-11-25T01:42:00.000-0600",
         raw={
             "timeSpent": "1h 15m",
             "comment": "DATE BEFORE",
             "timeSpentSeconds": (60 * 60) + (15 * 60),
         },
-        author=Mock(emailAddress="foo@bar")
+        author=Author(emailAddress="foo@bar")
     )
-    worklog3 = Mock(
+    worklog3 = Worklog(
         started="2023-11-26T17:24:00.000-0500",
         raw={
             "timeSpent": "2h",
             "comment": "WRONG AUTHOR",
             "timeSpentSeconds": 2 * 60 * 60,
         },
-        author=Mock(emailAddress="baz@quux")
+        author=Author(emailAddress="baz@quux")
     )
-    worklog4 = Mock(
+    worklog4 = Worklog(
         started="2023-11-27T01:42:00.000-0600",
         raw={
             "timeSpent": "1h 15m",
             "comment": "DATE AFTER",
             "timeSpentSeconds": (60 * 60) + (15 * 60),
         },
-        author=Mock(emailAddress="foo@bar")
+        author=Author(emailAddress="foo@bar")
     )
     mock_issue = Mock(fields=Mock(worklog=Mock(worklogs=[worklog1, worklog2, worklog3, worklog4])))
 
@@ -238,20 +246,19 @@ def test_get_issue_worklogs_by_user_and_date_from_the_issue(mock_jira):
     assert not mock_jira.called
 
 
-def test_get_issue_worklogs_by_user_and_date_from_jira(mock_jira):
-    mock_jira.worklogs = Mock(
-        return_value=[
-            Mock(
-                started="2023-11-26T13:42:16.000-0600",
-                raw={
-                    "timeSpent": "30m",
-                    "comment": "ONLY ONE MATCHING",
-                    "timeSpentSeconds": 30 * 60,
-                },
-                author=Mock(emailAddress="foo@bar")
-            )
-        ]
-    )
+def test_get_issue_worklogs_by_user_and_date_from_jira(mocker, mock_jira):
+    mock_jira.worklogs = mocker.stub(name="worklogs")
+    mock_jira.worklogs.return_value = [
+        Worklog(
+            started="2023-11-26T13:42:16.000-0600",
+            raw={
+                "timeSpent": "30m",
+                "comment": "ONLY ONE MATCHING",
+                "timeSpentSeconds": 30 * 60,
+            },
+            author=Author(emailAddress="foo@bar")
+        )
+    ]
     mock_issue = Mock(fields=Mock(worklog=Mock(worklogs=20 * [Mock()])))
     email_address = "foo@bar"
     report_date = datetime(2023, 11, 26, 0, 0).astimezone()
@@ -340,3 +347,13 @@ def test_search_issues_with_sprint_info_fetches_extra_fields(mock_jira, issues_d
         jql_str=f"project = {project_key} AND sprint in openSprints()",
         fields=",".join(["Foo", "Bar"] + issues_default_fields)
     )
+
+
+@pytest.mark.parametrize(
+    "worklogs,expected",
+    [(None, False), ([], False), (19 * [None], False), (20 * [None], True)],
+)
+def test_needs_worklogs_request_when_issue_embeds_the_worklogs_limit(worklogs, expected):
+    issue = Mock(fields=Mock(worklog=Mock(worklogs=worklogs)))
+
+    assert needs_worklogs_request(issue) is expected